@@ -0,0 +1,171 @@
+"""MinHash signatures + LSH index for near-duplicate text detection.
+
+Used by import_google_takeout.py to find content blocks that Google Sites
+repeats across many pages (headers, disclaimers, navigation) and pages that
+are near-copies of each other. Stdlib only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """Word n-gram shingles; texts shorter than `size` words become one shingle."""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [_shingle_hash(s) for s in shingle_set]
+        if not hashes:
+            return (MAX_HASH,) * self.num_perm
+        return tuple(min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes) for a, b in self.params)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def estimate_jaccard(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures.
+
+    With `bands` x `rows` = num_perm, pairs with Jaccard similarity s collide
+    in at least one band with probability 1 - (1 - s**rows) ** bands, so
+    lookups only compare against a handful of bucket-mates instead of the
+    whole corpus.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.threshold = threshold
+        self.buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [defaultdict(list) for _ in range(bands)]
+        self.signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def _band_keys(self, sig: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, sig[band * self.rows:(band + 1) * self.rows]
+
+    def candidates(self, sig: Tuple[int, ...]) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        for band, key in self._band_keys(sig):
+            found.update(self.buckets[band].get(key, ()))
+        return found
+
+    def query(self, sig: Tuple[int, ...]) -> List[Tuple[Hashable, float]]:
+        matches = []
+        for key in self.candidates(sig):
+            score = estimate_jaccard(sig, self.signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        return matches
+
+    def insert(self, key: Hashable, sig: Tuple[int, ...]):
+        self.signatures[key] = sig
+        for band, band_key in self._band_keys(sig):
+            self.buckets[band][band_key].append(key)
+
+
+def _assign_to_leaders(
+    items: Iterable[Tuple[Hashable, str]],
+    threshold: float,
+    num_perm: int,
+    bands: int,
+    shingle_size: int,
+) -> Iterator[Tuple[Hashable, Hashable, float]]:
+    """Yield (key, leader key, Jaccard similarity) for every item.
+
+    Only leaders are indexed: an item joins the most similar leader it
+    matches, otherwise it becomes a new leader. Buckets therefore hold one
+    entry per distinct cluster rather than every copy, and every member is
+    within `threshold` of its leader (no transitive chaining). LSH only
+    proposes candidates; they are verified with the exact Jaccard of the
+    shingle sets, since a 64-permutation estimate is too noisy near the
+    threshold. Exact-text repeats skip hashing entirely.
+    """
+    hasher = MinHasher(num_perm)
+    index = LSHIndex(num_perm, bands, threshold)
+    leader_shingles: Dict[Hashable, Set[str]] = {}
+    by_text: Dict[str, Tuple[Hashable, float]] = {}
+    for key, text in items:
+        normalized = " ".join(text.lower().split())
+        if normalized in by_text:
+            leader, score = by_text[normalized]
+            yield key, leader, score
+            continue
+        item_shingles = shingles(text, shingle_size)
+        sig = hasher.signature(item_shingles)
+        matches = [(c, jaccard(item_shingles, leader_shingles[c])) for c in index.candidates(sig)]
+        matches = [m for m in matches if m[1] >= threshold]
+        if matches:
+            leader, score = max(matches, key=lambda m: m[1])
+        else:
+            leader, score = key, 1.0
+            index.insert(key, sig)
+            leader_shingles[key] = item_shingles
+        by_text[normalized] = (leader, score)
+        yield key, leader, score
+
+
+def cluster_near_duplicates(
+    items: Iterable[Tuple[Hashable, str]],
+    *,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 16,
+    shingle_size: int = 5,
+) -> Dict[Hashable, Hashable]:
+    """Group near-identical texts; returns item key -> cluster leader key."""
+    return {
+        key: leader
+        for key, leader, _ in _assign_to_leaders(items, threshold, num_perm, bands, shingle_size)
+    }
+
+
+def find_near_duplicate_pairs(
+    items: Iterable[Tuple[Hashable, str]],
+    *,
+    threshold: float = 0.9,
+    num_perm: int = 64,
+    bands: int = 16,
+    shingle_size: int = 5,
+) -> List[Tuple[Hashable, Hashable, float]]:
+    """Return (leader key, later key, Jaccard) for near-duplicate texts.
+
+    Each duplicate is reported once, against the first text it matched.
+    """
+    return [
+        (leader, key, score)
+        for key, leader, score in _assign_to_leaders(items, threshold, num_perm, bands, shingle_size)
+        if leader != key
+    ]
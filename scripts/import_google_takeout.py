@@ -3,17 +3,25 @@
 
 Usage:
   python3 scripts/import_google_takeout.py [--zip PATH] [--limit N] [--dry-run]
+  python3 scripts/import_google_takeout.py --export-static [DIR] [--site-url URL] [--limit N]
 
 Required environment variables:
   SUPABASE_URL
   SUPABASE_SECRET_KEY (preferred) or SUPABASE_SERVICE_ROLE_KEY (legacy)
   IMPORT_AUTHOR_ID (preferred) OR IMPORT_AUTHOR_EMAIL
+
+Static export mode (--export-static) reads the imported (and cleaned) posts
+back from Supabase and writes them to disk as static JSON; it needs
+SUPABASE_URL, a service key and SITE_URL (or --site-url).
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import html
+import json
+import math
 import os
 import re
 import sys
@@ -21,17 +29,36 @@ import uuid
 import zipfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import PurePosixPath
-from typing import Dict, Optional
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
 from urllib.parse import quote
 
 import requests
 from bs4 import BeautifulSoup
 
+from block_minhash import cluster_near_duplicates, find_near_duplicate_pairs
+
 
 DEFAULT_ZIP = "_import/google-takeout/takeout.zip"
 PUBLISHED_PREFIX = "Takeout/Drive/Website/EM Gurus/PUBLISHED/"
 ASSET_BUCKET = os.environ.get("BLOG_ASSET_BUCKET", "blog-covers")
+DEFAULT_EXPORT_DIR = "public/static-blog"
+DEFAULT_SITEMAP_PATH = "public/sitemap.xml"
+# Vite copies public/ to the site root, so public/<dir> is served at /<dir>.
+PUBLIC_DIR = "public"
+# Bump when the exported output format changes so every post is rewritten.
+STATIC_EXPORT_VERSION = "3"
+# Columns copied into posts/{slug}.json; updated_at lets the blog page detect
+# posts edited (or re-imported) after the export.
+STATIC_POST_COLUMNS = "slug,title,description,content,cover_image_url,reading_minutes,updated_at"
+# Unless --boilerplate-min-pages is given, a near-identical block counts as
+# site boilerplate on at least this many pages and this share of the corpus.
+BOILERPLATE_MIN_PAGES = 5
+BOILERPLATE_MIN_FRACTION = 0.05
+# Shorter blocks ("References", "Key points") are real headings, never boilerplate.
+BOILERPLATE_MIN_WORDS = 8
+BLOCK_SIMILARITY = 0.8
+PAGE_SIMILARITY = 0.9
 
 
 @dataclass
@@ -43,6 +70,43 @@ class ImportStats:
     uploaded_assets: int = 0
 
 
+@dataclass
+class ExportStats:
+    written: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    removed: int = 0
+    assets: int = 0
+    removed_assets: int = 0
+
+
+@dataclass
+class ContentBlock:
+    html: str
+    text: str
+
+
+@dataclass
+class TakeoutPage:
+    html_path: str
+    file_name: str
+    slug: str
+    title: str
+    content_html: str
+    excerpt: str
+    raw: bytes
+    # .tyJCtd blocks; empty when the page fell back to the whole body.
+    blocks: List[ContentBlock]
+
+
+@dataclass
+class BoilerplateStats:
+    clusters: int = 0
+    stripped_blocks: int = 0
+    stripped_bytes: int = 0
+    near_duplicate_pages: int = 0
+
+
 def slugify(value: str) -> str:
     v = value.strip().lower()
     v = re.sub(r"\.html?$", "", v)
@@ -128,6 +192,19 @@ class SupabaseClient:
         )
         return bool(data)
 
+    def fetch_published_posts(self, slugs: List[str]) -> Dict[str, dict]:
+        rows: Dict[str, dict] = {}
+        # Keep the slug filter well under URL length limits.
+        for i in range(0, len(slugs), 100):
+            batch = ",".join(f'"{slug}"' for slug in slugs[i:i + 100])
+            data = self.rest(
+                "GET",
+                "blog_posts",
+                params={"select": STATIC_POST_COLUMNS, "status": "eq.published", "slug": f"in.({batch})"},
+            )
+            rows.update({row["slug"]: row for row in data or []})
+        return rows
+
     def upload_asset(self, object_path: str, blob: bytes, content_type: str):
         hdrs = dict(self.base_headers)
         hdrs["x-upsert"] = "true"
@@ -145,38 +222,44 @@ class SupabaseClient:
         return f"{self.url}/storage/v1/object/public/{ASSET_BUCKET}/{quote(object_path)}"
 
 
-def extract_main_content(html_text: str) -> tuple[str, str, str]:
+def join_content_blocks(blocks: List[ContentBlock]) -> tuple[str, str]:
+    content_html = "\n".join(b.html for b in blocks)
+    excerpt = " ".join(b.text for b in blocks)[:280].strip()
+    return content_html, excerpt
+
+
+def extract_main_content(html_text: str) -> tuple[str, str, str, List[ContentBlock]]:
     soup = BeautifulSoup(html_text, "html.parser")
 
     title_tag = soup.find("h1")
     page_title = title_tag.get_text(" ", strip=True) if title_tag else ""
 
     # Google Sites exports keep page content in .tyJCtd blocks.
-    blocks = []
+    blocks: List[ContentBlock] = []
     seen = set()
     for node in soup.select(".tyJCtd"):
         text = re.sub(r"\s+", " ", node.get_text(" ", strip=True)).strip()
         if not text or text in seen:
             continue
         seen.add(text)
-        blocks.append(str(node))
+        blocks.append(ContentBlock(html=str(node), text=text))
 
     if blocks:
-        content_html = "\n".join(blocks)
-        text = " ".join(re.sub(r"\s+", " ", BeautifulSoup(b, "html.parser").get_text(" ", strip=True)) for b in blocks)
-    else:
-        # fallback: entire body (minus scripts/styles)
-        fallback = BeautifulSoup(html_text, "html.parser")
-        for bad in fallback(["script", "style", "noscript", "meta", "link"]):
-            bad.decompose()
-        main = fallback.body or fallback
-        for noise in main.select('header, footer, nav, [role="navigation"], [aria-label="Breadcrumbs"]'):
-            noise.decompose()
-        content_html = str(main)
-        text = main.get_text(" ", strip=True)
+        content_html, excerpt = join_content_blocks(blocks)
+        return page_title, content_html, excerpt, blocks
+
+    # fallback: entire body (minus scripts/styles)
+    fallback = BeautifulSoup(html_text, "html.parser")
+    for bad in fallback(["script", "style", "noscript", "meta", "link"]):
+        bad.decompose()
+    main = fallback.body or fallback
+    for noise in main.select('header, footer, nav, [role="navigation"], [aria-label="Breadcrumbs"]'):
+        noise.decompose()
+    content_html = str(main)
+    text = main.get_text(" ", strip=True)
 
     excerpt = re.sub(r"\s+", " ", text)[:280].strip()
-    return page_title, content_html, excerpt
+    return page_title, content_html, excerpt, []
 
 
 def infer_content_type(path: str) -> str:
@@ -190,6 +273,38 @@ def infer_content_type(path: str) -> str:
     return "image/jpeg"
 
 
+def resolve_zip_asset(zip_file: zipfile.ZipFile, html_dir: str, src: Optional[str]) -> Optional[str]:
+    src = (src or "").strip()
+    if not src or src.startswith("http") or src.startswith("data:"):
+        return None
+
+    resolved = str(PurePosixPath(html_dir) / src)
+    resolved = resolved.replace("%20", " ")
+    if resolved not in zip_file.namelist():
+        # some exports have files at PUBLISHED root instead of nested folder
+        fallback = str(PurePosixPath(PUBLISHED_PREFIX) / PurePosixPath(src).name)
+        if fallback in zip_file.namelist():
+            return fallback
+        return None
+    return resolved
+
+
+def rewrite_internal_links(soup: BeautifulSoup):
+    for a in soup.find_all("a"):
+        href = (a.get("href") or "").strip()
+        if not href or href.startswith(("http://", "https://", "mailto:", "tel:", "#")):
+            continue
+        href_clean = href.split("#", 1)[0].split("?", 1)[0]
+        if href_clean.lower().endswith(".html"):
+            internal_name = PurePosixPath(href_clean).name
+            internal_slug = slugify(internal_name)
+            a["href"] = f"/blog/{internal_slug}"
+
+
+def takeout_asset_object_name(slug: str, resolved: str) -> str:
+    return f"takeout/{slug}/{PurePosixPath(resolved).name}"
+
+
 def rewrite_html_and_upload_assets(
     raw_html: str,
     zip_file: zipfile.ZipFile,
@@ -206,24 +321,14 @@ def rewrite_html_and_upload_assets(
     first_image_url: Optional[str] = None
 
     for img in soup.find_all("img"):
-        src = (img.get("src") or "").strip()
-        if not src or src.startswith("http") or src.startswith("data:"):
+        resolved = resolve_zip_asset(zip_file, html_dir, img.get("src"))
+        if not resolved:
             continue
 
-        resolved = str(PurePosixPath(html_dir) / src)
-        resolved = resolved.replace("%20", " ")
-        if resolved not in zip_file.namelist():
-            # some exports have files at PUBLISHED root instead of nested folder
-            fallback = str(PurePosixPath(PUBLISHED_PREFIX) / PurePosixPath(src).name)
-            if fallback in zip_file.namelist():
-                resolved = fallback
-            else:
-                continue
-
         if resolved in asset_cache:
             public_url = asset_cache[resolved]
         else:
-            object_name = f"takeout/{slug}/{PurePosixPath(resolved).name}"
+            object_name = takeout_asset_object_name(slug, resolved)
             public_url = supabase.public_asset_url(object_name)
             if not dry_run:
                 blob = zip_file.read(resolved)
@@ -235,34 +340,355 @@ def rewrite_html_and_upload_assets(
         if not first_image_url:
             first_image_url = public_url
 
-    for a in soup.find_all("a"):
-        href = (a.get("href") or "").strip()
-        if not href or href.startswith(("http://", "https://", "mailto:", "tel:", "#")):
+    rewrite_internal_links(soup)
+    return str(soup), first_image_url
+
+
+def list_published_pages(zip_file: zipfile.ZipFile, limit: Optional[int]) -> List[str]:
+    html_files = [
+        n for n in zip_file.namelist()
+        if n.startswith(PUBLISHED_PREFIX) and n.lower().endswith(".html")
+    ]
+    html_files.sort()
+    if limit:
+        html_files = html_files[:limit]
+    return html_files
+
+
+def parse_takeout_page(zip_file: zipfile.ZipFile, html_path: str) -> Optional[TakeoutPage]:
+    file_name = PurePosixPath(html_path).name
+    if file_name.lower() in {"home.html"}:
+        return None
+
+    raw = zip_file.read(html_path)
+    page_title, content_html, excerpt, blocks = extract_main_content(raw.decode("utf-8", errors="ignore"))
+    return TakeoutPage(
+        html_path=html_path,
+        file_name=file_name,
+        slug=slugify(file_name),
+        title=clean_title(page_title, file_name.replace(".html", "")),
+        content_html=content_html,
+        excerpt=excerpt,
+        raw=raw,
+        blocks=blocks,
+    )
+
+
+def boilerplate_page_threshold(page_count: int, min_pages: Optional[int], min_fraction: float) -> int:
+    if min_pages is not None:
+        return min_pages
+    return max(BOILERPLATE_MIN_PAGES, math.ceil(min_fraction * page_count))
+
+
+def strip_site_boilerplate(
+    pages: List[TakeoutPage],
+    min_pages: Optional[int] = None,
+    min_fraction: float = BOILERPLATE_MIN_FRACTION,
+) -> BoilerplateStats:
+    """Drop blocks that recur near-identically across many pages.
+
+    Blocks of at least BOILERPLATE_MIN_WORDS words from the whole corpus go
+    through a MinHash/LSH index, so each block is only compared with likely
+    matches rather than every other block. A cluster counts as boilerplate
+    when it spans `min_pages` pages or, if that is not given, the larger of
+    BOILERPLATE_MIN_PAGES and `min_fraction` of the corpus. Every member is
+    within BLOCK_SIMILARITY of the cluster's first block. Pages that would be left empty keep their blocks. Near-duplicate
+    pages are reported but left alone.
+    """
+    stats = BoilerplateStats()
+    items = [
+        ((pi, bi), block.text)
+        for pi, page in enumerate(pages)
+        for bi, block in enumerate(page.blocks)
+        if len(re.findall(r"\w+", block.text)) >= BOILERPLATE_MIN_WORDS
+    ]
+    clusters = cluster_near_duplicates(items, threshold=BLOCK_SIMILARITY)
+
+    pages_per_cluster: Dict[tuple, set] = {}
+    for (pi, _), leader in clusters.items():
+        pages_per_cluster.setdefault(leader, set()).add(pi)
+    required = boilerplate_page_threshold(len(pages), min_pages, min_fraction)
+    boilerplate = {leader for leader, page_ids in pages_per_cluster.items() if len(page_ids) >= required}
+    stats.clusters = len(boilerplate)
+
+    for pi, page in enumerate(pages):
+        kept = [b for bi, b in enumerate(page.blocks) if clusters.get((pi, bi)) not in boilerplate]
+        if not kept or len(kept) == len(page.blocks):
             continue
-        href_clean = href.split("#", 1)[0].split("?", 1)[0]
-        if href_clean.lower().endswith(".html"):
-            internal_name = PurePosixPath(href_clean).name
-            internal_slug = slugify(internal_name)
-            a["href"] = f"/blog/{internal_slug}"
+        stats.stripped_blocks += len(page.blocks) - len(kept)
+        before = len(page.content_html.encode("utf-8"))
+        page.blocks = kept
+        page.content_html, page.excerpt = join_content_blocks(kept)
+        stats.stripped_bytes += before - len(page.content_html.encode("utf-8"))
 
-    return str(soup), first_image_url
+    page_texts = [(pi, " ".join(b.text for b in page.blocks)) for pi, page in enumerate(pages) if page.blocks]
+    for a, b, score in find_near_duplicate_pairs(page_texts, threshold=PAGE_SIMILARITY):
+        stats.near_duplicate_pages += 1
+        print(f"Near-duplicate pages ({score:.2f}): {pages[a].slug} ~ {pages[b].slug}")
+
+    return stats
+
+
+def load_pages(
+    zip_file: zipfile.ZipFile,
+    html_files: List[str],
+    boilerplate_min_pages: Optional[int] = None,
+    boilerplate_min_fraction: float = BOILERPLATE_MIN_FRACTION,
+) -> List[TakeoutPage]:
+    pages = [page for page in (parse_takeout_page(zip_file, p) for p in html_files) if page]
+    if boilerplate_min_pages != 0:
+        stats = strip_site_boilerplate(pages, boilerplate_min_pages, boilerplate_min_fraction)
+        print(
+            f"Stripped {stats.stripped_blocks} boilerplate blocks "
+            f"({stats.clusters} site-wide clusters, {stats.stripped_bytes} bytes); "
+            f"{stats.near_duplicate_pages} near-duplicate page pairs"
+        )
+    return pages
+
+
+def sha256_hex(blob: bytes) -> str:
+    return hashlib.sha256(blob).hexdigest()
+
+
+def write_file_atomic(path: Path, blob: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+
+
+def imported_asset_urls(
+    pages: List[TakeoutPage],
+    zip_file: zipfile.ZipFile,
+    supabase: SupabaseClient,
+) -> Dict[str, str]:
+    """Map each Storage URL the importer gave a zip image back to the zip path.
+
+    Mirrors rewrite_html_and_upload_assets: an image is stored under the slug
+    of the first page that references it.
+    """
+    by_zip_path: Dict[str, str] = {}
+    for page in pages:
+        soup = BeautifulSoup(page.content_html, "html.parser")
+        html_dir = str(PurePosixPath(page.html_path).parent)
+        for img in soup.find_all("img"):
+            resolved = resolve_zip_asset(zip_file, html_dir, img.get("src"))
+            if resolved and resolved not in by_zip_path:
+                by_zip_path[resolved] = supabase.public_asset_url(takeout_asset_object_name(page.slug, resolved))
+    return {url: resolved for resolved, url in by_zip_path.items()}
+
+
+def export_static_assets(
+    raw_html: str,
+    cover_url: Optional[str],
+    zip_file: zipfile.ZipFile,
+    url_to_zip_path: Dict[str, str],
+    out_dir: Path,
+    url_prefix: str,
+    asset_cache: Dict[str, str],
+    stats: ExportStats,
+) -> tuple[str, Optional[str], List[str]]:
+    """Copy imported images to content-hashed paths and point the HTML at them.
+
+    Returns the rewritten HTML, the rewritten cover URL and the
+    output-relative paths of every referenced asset. The paths embed the
+    content hash, so they also invalidate the post's source hash when an
+    image changes.
+    """
+    asset_paths: List[str] = []
+
+    def localize(url: Optional[str]) -> Optional[str]:
+        resolved = url_to_zip_path.get(url or "")
+        if not resolved:
+            return url
+        if resolved not in asset_cache:
+            blob = zip_file.read(resolved)
+            name = PurePosixPath(resolved)
+            rel_path = f"assets/{slugify(name.stem)}.{sha256_hex(blob)[:12]}{name.suffix.lower()}"
+            target = out_dir / rel_path
+            if not target.exists():
+                write_file_atomic(target, blob)
+                stats.assets += 1
+            asset_cache[resolved] = rel_path
+        asset_paths.append(asset_cache[resolved])
+        return f"{url_prefix}/{asset_cache[resolved]}"
+
+    soup = BeautifulSoup(raw_html, "html.parser")
+    for img in soup.find_all("img"):
+        img["src"] = localize(img.get("src"))
+    cover = localize(cover_url)
+    return str(soup), cover, asset_paths
+
+
+def render_sitemap(site_url: str, slugs: List[str]) -> str:
+    urls = "".join(
+        f"  <url><loc>{html.escape(f'{site_url}/blog/{slug}')}</loc></url>\n" for slug in sorted(slugs)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{urls}"
+        "</urlset>\n"
+    )
+
+
+def default_url_prefix(out_dir: str) -> str:
+    out = Path(out_dir).resolve()
+    public = Path(PUBLIC_DIR).resolve()
+    if out == public or public not in out.parents:
+        raise RuntimeError(f"--url-prefix is required when the export directory is outside {PUBLIC_DIR}/")
+    return "/" + out.relative_to(public).as_posix()
+
+
+def export_static(
+    zip_path: str,
+    out_dir: str,
+    site_url: str,
+    limit: Optional[int],
+    supabase: SupabaseClient,
+    *,
+    url_prefix: str,
+    sitemap_path: str = DEFAULT_SITEMAP_PATH,
+    boilerplate_min_pages: Optional[int] = None,
+    boilerplate_min_fraction: float = BOILERPLATE_MIN_FRACTION,
+) -> ExportStats:
+    """Write every imported post as static JSON plus hashed assets.
+
+    Content comes from blog_posts (so cleanup passes and edits are kept); the
+    zip is only used to find which posts were imported and to copy their
+    images. A manifest keyed by slug records each post's source hash, files
+    and assets; posts whose entry is unchanged (and whose files still exist)
+    are not rewritten. Full runs delete posts and assets nothing references.
+    """
+    site_url = site_url.rstrip("/")
+    url_prefix = url_prefix.rstrip("/")
+    out = Path(out_dir)
+    manifest_path = out / "manifest.json"
+    manifest: Dict[str, dict] = {}
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text()).get("posts", {})
+
+    stats = ExportStats()
+    asset_cache: Dict[str, str] = {}
+    exported: Dict[str, dict] = {}
+
+    with zipfile.ZipFile(zip_path) as zf:
+        html_files = list_published_pages(zf, limit)
+        print(f"Found {len(html_files)} published HTML pages")
+
+        pages = load_pages(zf, html_files, boilerplate_min_pages, boilerplate_min_fraction)
+        url_to_zip_path = imported_asset_urls(pages, zf, supabase)
+        rows = supabase.fetch_published_posts([page.slug for page in pages])
+
+        for page in pages:
+            row = rows.get(page.slug)
+            if not row:
+                stats.missing += 1
+                print(f"Not imported, skipping: {page.slug}")
+                continue
 
+            content_html, cover, asset_paths = export_static_assets(
+                row.get("content") or "",
+                row.get("cover_image_url"),
+                zf,
+                url_to_zip_path,
+                out,
+                url_prefix,
+                asset_cache,
+                stats,
+            )
+            post_json = {
+                "title": row["title"],
+                "slug": page.slug,
+                "description": row.get("description"),
+                "content": content_html,
+                "cover_image_url": cover,
+                "reading_minutes": row.get("reading_minutes"),
+                # The blog page only uses this file while it matches the row.
+                "updated_at": row["updated_at"],
+            }
+            post_blob = json.dumps(post_json, ensure_ascii=False, sort_keys=True).encode("utf-8")
 
-def import_takeout(zip_path: str, limit: Optional[int], dry_run: bool):
-    supabase: Optional[SupabaseClient] = None
+            json_file = f"posts/{page.slug}.json"
+            entry = {
+                "source_hash": sha256_hex(STATIC_EXPORT_VERSION.encode() + b"\0" + post_blob),
+                "files": [json_file],
+                "assets": sorted(set(asset_paths)),
+            }
+            previous = manifest.get(page.slug, {})
+            if previous == entry and all((out / f).exists() for f in entry["files"]):
+                exported[page.slug] = entry
+                stats.unchanged += 1
+                continue
+            for rel in set(previous.get("files", [])) - set(entry["files"]):
+                (out / rel).unlink(missing_ok=True)
+
+            write_file_atomic(out / json_file, post_blob)
+            exported[page.slug] = entry
+            stats.written += 1
+            print(f"Exported: {page.slug}")
+
+    # A --limit run only sees part of the zip, so keep posts it did not visit.
+    if limit:
+        exported = {**manifest, **exported}
+    else:
+        for slug, entry in manifest.items():
+            if slug in exported:
+                continue
+            for rel in entry.get("files", []):
+                (out / rel).unlink(missing_ok=True)
+            stats.removed += 1
+
+        referenced = {rel for entry in exported.values() for rel in entry.get("assets", [])}
+        assets_dir = out / "assets"
+        if assets_dir.exists():
+            for asset in assets_dir.iterdir():
+                if asset.is_file() and f"assets/{asset.name}" not in referenced:
+                    asset.unlink()
+                    stats.removed_assets += 1
+
+    sitemap = render_sitemap(site_url, list(exported)).encode("utf-8")
+    sitemap_file = Path(sitemap_path)
+    if not sitemap_file.exists() or sitemap_file.read_bytes() != sitemap:
+        write_file_atomic(sitemap_file, sitemap)
+
+    manifest_blob = json.dumps({"version": STATIC_EXPORT_VERSION, "posts": exported}, indent=2, sort_keys=True)
+    write_file_atomic(manifest_path, (manifest_blob + "\n").encode("utf-8"))
+
+    print("\nStatic export complete")
+    print(f"  Written posts:    {stats.written}")
+    print(f"  Unchanged posts:  {stats.unchanged}")
+    print(f"  Not imported:     {stats.missing}")
+    print(f"  Removed posts:    {stats.removed}")
+    print(f"  New assets:       {stats.assets}")
+    print(f"  Removed assets:   {stats.removed_assets}")
+    return stats
+
+
+def supabase_from_env() -> SupabaseClient:
+    supabase_url = os.environ.get("SUPABASE_URL")
+    service_key = os.environ.get("SUPABASE_SECRET_KEY") or os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+    if not supabase_url or not service_key:
+        raise RuntimeError("SUPABASE_URL and SUPABASE_SECRET_KEY (or SUPABASE_SERVICE_ROLE_KEY) are required")
+    return SupabaseClient(supabase_url, service_key)
+
+
+def import_takeout(
+    zip_path: str,
+    limit: Optional[int],
+    dry_run: bool,
+    boilerplate_min_pages: Optional[int] = None,
+    boilerplate_min_fraction: float = BOILERPLATE_MIN_FRACTION,
+    supabase: Optional[SupabaseClient] = None,
+):
     author_id: Optional[str] = None
     category_id: Optional[str] = None
 
     if not dry_run:
-        supabase_url = os.environ.get("SUPABASE_URL")
-        service_key = os.environ.get("SUPABASE_SECRET_KEY") or os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-        if not supabase_url or not service_key:
-            raise RuntimeError("SUPABASE_URL and SUPABASE_SECRET_KEY (or SUPABASE_SERVICE_ROLE_KEY) are required")
-
         import_author_id = os.environ.get("IMPORT_AUTHOR_ID")
         import_author_email = os.environ.get("IMPORT_AUTHOR_EMAIL")
 
-        supabase = SupabaseClient(supabase_url, service_key)
+        supabase = supabase or supabase_from_env()
         author_id = supabase.resolve_author_id(import_author_id, import_author_email)
         category_id = supabase.get_or_create_imported_category_id()
 
@@ -270,28 +696,16 @@ def import_takeout(zip_path: str, limit: Optional[int], dry_run: bool):
     asset_cache: Dict[str, str] = {}
 
     with zipfile.ZipFile(zip_path) as zf:
-        html_files = [
-            n for n in zf.namelist()
-            if n.startswith(PUBLISHED_PREFIX) and n.lower().endswith(".html")
-        ]
-        html_files.sort()
-        if limit:
-            html_files = html_files[:limit]
-
+        html_files = list_published_pages(zf, limit)
         print(f"Found {len(html_files)} published HTML pages")
 
-        for html_path in html_files:
-            stats.scanned += 1
-            file_name = PurePosixPath(html_path).name
-            if file_name.lower() in {"home.html"}:
-                stats.skipped += 1
-                continue
-
-            raw = zf.read(html_path).decode("utf-8", errors="ignore")
-            page_title, content_html, excerpt = extract_main_content(raw)
-            title = clean_title(page_title, file_name.replace(".html", ""))
-            slug = slugify(file_name)
+        pages = load_pages(zf, html_files, boilerplate_min_pages, boilerplate_min_fraction)
+        stats.scanned = len(html_files)
+        stats.skipped = len(html_files) - len(pages)
 
+        for page in pages:
+            html_path = page.html_path
+            content_html = page.content_html
             if dry_run:
                 cover = None
             else:
@@ -299,7 +713,7 @@ def import_takeout(zip_path: str, limit: Optional[int], dry_run: bool):
                     content_html,
                     zf,
                     html_path,
-                    slug,
+                    page.slug,
                     supabase,
                     asset_cache,
                     stats,
@@ -308,27 +722,27 @@ def import_takeout(zip_path: str, limit: Optional[int], dry_run: bool):
 
             now = datetime.now(timezone.utc).isoformat()
             payload = {
-                "title": title,
-                "slug": slug,
-                "description": excerpt or title,
+                "title": page.title,
+                "slug": page.slug,
+                "description": page.excerpt or page.title,
                 "content": content_html,
                 "cover_image_url": cover,
                 "category_id": category_id,
                 "author_id": author_id,
                 "status": "published",
                 "published_at": now,
-                "reading_minutes": estimate_reading_minutes(excerpt or title),
+                "reading_minutes": estimate_reading_minutes(page.excerpt or page.title),
                 "updated_at": now,
             }
 
             if dry_run:
-                print(f"[DRY RUN] {slug} <- {html_path}")
+                print(f"[DRY RUN] {page.slug} <- {html_path}")
                 stats.imported += 1
                 continue
 
             supabase.upsert_post(payload)
             stats.imported += 1
-            print(f"Imported: {slug}")
+            print(f"Imported: {page.slug}")
 
     print("\nImport complete")
     print(f"  Scanned pages:    {stats.scanned}")
@@ -342,13 +756,59 @@ def main():
     parser.add_argument("--zip", default=DEFAULT_ZIP, help="Path to Google Takeout zip")
     parser.add_argument("--limit", type=int, default=None, help="Import only first N pages")
     parser.add_argument("--dry-run", action="store_true", help="Parse and print without writing to Supabase")
+    parser.add_argument(
+        "--export-static",
+        nargs="?",
+        const=DEFAULT_EXPORT_DIR,
+        default=None,
+        metavar="DIR",
+        help=f"Export imported posts as static JSON to DIR (default {DEFAULT_EXPORT_DIR}) instead of importing",
+    )
+    parser.add_argument(
+        "--url-prefix",
+        default=None,
+        help=f"URL the export directory is served at (derived from DIR when it is inside {PUBLIC_DIR}/)",
+    )
+    parser.add_argument("--sitemap", default=DEFAULT_SITEMAP_PATH, help="Where to write the blog sitemap")
+    parser.add_argument("--site-url", default=os.environ.get("SITE_URL"), help="Public site origin for sitemap URLs")
+    parser.add_argument(
+        "--boilerplate-min-pages",
+        type=int,
+        default=None,
+        help=(
+            "Strip blocks repeated near-identically on at least N pages (0 disables); "
+            f"default max({BOILERPLATE_MIN_PAGES}, --boilerplate-min-fraction of pages)"
+        ),
+    )
+    parser.add_argument(
+        "--boilerplate-min-fraction",
+        type=float,
+        default=BOILERPLATE_MIN_FRACTION,
+        help="Share of pages a block must repeat on when --boilerplate-min-pages is not given",
+    )
     args = parser.parse_args()
 
     zip_path = args.zip
     if not os.path.exists(zip_path):
         raise RuntimeError(f"Zip not found: {zip_path}")
 
-    import_takeout(zip_path, args.limit, args.dry_run)
+    if args.export_static:
+        if not args.site_url:
+            raise RuntimeError("SITE_URL (or --site-url) is required for --export-static")
+        export_static(
+            zip_path,
+            args.export_static,
+            args.site_url,
+            args.limit,
+            supabase_from_env(),
+            url_prefix=args.url_prefix or default_url_prefix(args.export_static),
+            sitemap_path=args.sitemap,
+            boilerplate_min_pages=args.boilerplate_min_pages,
+            boilerplate_min_fraction=args.boilerplate_min_fraction,
+        )
+        return
+
+    import_takeout(zip_path, args.limit, args.dry_run, args.boilerplate_min_pages, args.boilerplate_min_fraction)
 
 
 if __name__ == "__main__":
@@ -210,22 +210,52 @@ export async function listBlogs(params: {
   }
 }
 
+// Pre-rendered posts written by `npm run export:blog` (scripts/import_google_takeout.py).
+const STATIC_BLOG_BASE = "/static-blog/posts";
+const BLOG_DETAIL_COLUMNS =
+  "id, title, slug, description, cover_image_url, category_id, author_id, view_count, published_at, created_at, updated_at, breadcrumb_path, parent_slug";
+
+interface StaticBlogPost {
+  slug: string;
+  content: string;
+  cover_image_url?: string | null;
+  updated_at: string;
+}
+
+async function getStaticBlog(slug: string): Promise<StaticBlogPost | null> {
+  try {
+    const res = await fetch(`${STATIC_BLOG_BASE}/${encodeURIComponent(slug)}.json`);
+    if (!res.ok) return null;
+    const data = await res.json();
+    return data?.slug === slug && typeof data.content === "string" ? data : null;
+  } catch {
+    return null;
+  }
+}
+
 export async function getBlog(slug: string): Promise<BlogDetailPayload> {
-  // Primary path: direct Supabase query
-  const { data: post, error } = await supabase
-    .from("blog_posts")
-    .select("*")
-    .eq("slug", slug)
-    .eq("status", "published")
-    .maybeSingle();
+  // Content comes from the edge-cached export when there is one for this exact
+  // row version; metadata always comes from Supabase.
+  const [staticPost, { data: post, error }] = await Promise.all([
+    getStaticBlog(slug),
+    supabase
+      .from("blog_posts")
+      .select(BLOG_DETAIL_COLUMNS)
+      .eq("slug", slug)
+      .eq("status", "published")
+      .maybeSingle(),
+  ]);
 
   if (error || !post) throw new Error("Post not found");
 
+  const freshStatic =
+    staticPost && new Date(staticPost.updated_at).getTime() === new Date(post.updated_at).getTime() ? staticPost : null;
+
   // Get current user for like status
   const { data: { session } } = await supabase.auth.getSession();
   const userId = session?.user?.id;
 
-  const [authorRes, categoryRes, tagsRes, aiSummaryRes, commentCountRes, likesCountRes, sharesCountRes, userLikeRes] = await Promise.all([
+  const [authorRes, categoryRes, tagsRes, aiSummaryRes, commentCountRes, likesCountRes, sharesCountRes, userLikeRes, contentRes] = await Promise.all([
     supabase.from("profiles").select("id, display_name, avatar_url").eq("id", post.author_id).maybeSingle(),
     post.category_id ? supabase.from("blog_categories").select("id, title, slug").eq("id", post.category_id).maybeSingle() : Promise.resolve({ data: null }),
     supabase.from("blog_post_tags").select("tag:blog_tags(slug, title)").eq("post_id", post.id),
@@ -234,6 +264,7 @@ export async function getBlog(slug: string): Promise<BlogDetailPayload> {
     supabase.from("blog_likes").select("post_id", { count: "exact", head: true }).eq("post_id", post.id),
     supabase.from("blog_shares").select("id", { count: "exact", head: true }).eq("post_id", post.id),
     userId ? supabase.from("blog_likes").select("post_id").eq("post_id", post.id).eq("user_id", userId).maybeSingle() : Promise.resolve({ data: null }),
+    freshStatic ? Promise.resolve({ data: null }) : supabase.from("blog_posts").select("content").eq("id", post.id).maybeSingle(),
   ]);
 
   return {
@@ -241,8 +272,8 @@ export async function getBlog(slug: string): Promise<BlogDetailPayload> {
     title: post.title,
     slug: post.slug,
     excerpt: post.description,
-    content: post.content || "",
-    cover_image_url: post.cover_image_url,
+    content: (freshStatic ? freshStatic.content : contentRes.data?.content) || "",
+    cover_image_url: freshStatic ? freshStatic.cover_image_url : post.cover_image_url,
     category: categoryRes.data,
     tags: tagsRes.data?.map((t: any) => t.tag) || [],
     author: authorRes.data ? {
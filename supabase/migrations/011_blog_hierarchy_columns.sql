@@ -0,0 +1,7 @@
+-- 011_blog_hierarchy_columns.sql
+-- Breadcrumb hierarchy columns populated by scripts/build_hierarchy.py.
+-- The blog detail page selects them explicitly, so they must always exist.
+
+alter table public.blog_posts
+  add column if not exists breadcrumb_path text[] default '{}',
+  add column if not exists parent_slug text default null;
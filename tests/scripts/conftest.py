@@ -0,0 +1,29 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The import scripts are run as `python3 scripts/<name>.py`, so they import
+# each other as top-level modules.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+
+@pytest.fixture
+def disclaimer():
+    return (
+        "This content is for educational purposes only and does not replace "
+        "clinical judgement. Always consult local guidelines before acting."
+    )
+
+
+@pytest.fixture
+def random_text():
+    """Return `make(seed_or_rng, words=60)` building unrelated word soup."""
+
+    def make(rng, words=60):
+        if not isinstance(rng, random.Random):
+            rng = random.Random(rng)
+        return " ".join(f"w{rng.randrange(10_000)}" for _ in range(words))
+
+    return make
@@ -0,0 +1,60 @@
+import random
+
+from block_minhash import cluster_near_duplicates, find_near_duplicate_pairs, shingles
+
+
+def test_exact_duplicates_share_a_cluster(disclaimer):
+    clusters = cluster_near_duplicates([(i, disclaimer) for i in range(50)])
+    assert set(clusters.values()) == {0}
+
+
+def test_near_identical_texts_share_a_cluster(random_text):
+    base = random_text(0, 200)
+    clusters = cluster_near_duplicates([("a", base), ("b", base + " w1"), ("c", "w2 " + base)])
+    assert clusters == {"a": "a", "b": "a", "c": "a"}
+
+
+def test_one_word_edits_near_threshold_join_their_leader(random_text):
+    # Replacing one word of a 60-word block changes 5 of 56 shingles
+    # (Jaccard ~0.84), just above the 0.8 threshold.
+    rng = random.Random(4)
+    trials = 300
+    joined = 0
+    for trial in range(trials):
+        words = random_text(rng).split()
+        edited = list(words)
+        edited[rng.randrange(5, 55)] = "edited"
+        clusters = cluster_near_duplicates([("leader", " ".join(words)), ("copy", " ".join(edited))])
+        joined += clusters["copy"] == "leader"
+    assert joined == trials
+
+
+def test_unrelated_texts_do_not_cluster(random_text):
+    rng = random.Random(1)
+    clusters = cluster_near_duplicates([(i, random_text(rng)) for i in range(200)])
+    assert all(key == leader for key, leader in clusters.items())
+
+
+def test_members_stay_within_threshold_of_leader():
+    # Each text shares most shingles with its neighbour, but the ends of the
+    # chain are unrelated: no transitive merging.
+    rng = random.Random(2)
+    words = [f"w{rng.randrange(10_000)}" for _ in range(400)]
+    chain = [(i, " ".join(words[i * 20:i * 20 + 200])) for i in range(10)]
+    clusters = cluster_near_duplicates(chain, threshold=0.8)
+    assert clusters[0] != clusters[9]
+
+
+def test_short_texts_are_a_single_shingle():
+    assert shingles("References") == {"references"}
+    assert shingles("") == set()
+    assert len(shingles("one two three four five six")) == 2
+
+
+def test_near_duplicate_pairs_found(random_text):
+    rng = random.Random(3)
+    pages = [(f"p{i}", random_text(rng, 300)) for i in range(20)]
+    copy_text = pages[4][1] + " w99999"
+    pairs = find_near_duplicate_pairs(pages + [("copy", copy_text), ("exact", pages[7][1])])
+    assert {(a, b) for a, b, _ in pairs} == {("p4", "copy"), ("p7", "exact")}
+    assert all(score >= 0.9 for _, _, score in pairs)
@@ -0,0 +1,179 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("requests")
+
+from cleanup_blog_content import clean_content  # noqa: E402
+from import_google_takeout import PUBLISHED_PREFIX, SupabaseClient, export_static, import_takeout  # noqa: E402
+
+
+class FakeSupabase(SupabaseClient):
+    """In-memory stand-in for the REST/Storage calls the importer makes."""
+
+    def __init__(self):
+        super().__init__("https://db.example.test", "service-key")
+        self.rows = {}
+        self.uploads = {}
+        self.clock = 0
+
+    def bump(self, slug, changes):
+        # Mirrors the updated_at trigger on blog_posts.
+        self.clock += 1
+        self.rows[slug].update(changes, updated_at=f"2026-01-01T00:00:{self.clock:02d}+00:00")
+
+    def resolve_author_id(self, import_author_id, import_author_email):
+        return "author"
+
+    def get_or_create_imported_category_id(self):
+        return "imported"
+
+    def upsert_post(self, payload):
+        self.rows.setdefault(payload["slug"], {})
+        self.bump(payload["slug"], payload)
+        return True
+
+    def upload_asset(self, object_path, blob, content_type):
+        self.uploads[object_path] = blob
+
+    def fetch_published_posts(self, slugs):
+        return {slug: dict(self.rows[slug]) for slug in slugs if slug in self.rows}
+
+
+def page_html(title, body):
+    return (
+        f"<h1>EM Gurus - {title}</h1>"
+        f'<div class="tyJCtd"><p>EM Gurus &gt; Topics &gt; {title}</p></div>'
+        f'<div class="tyJCtd"><p style="">{body}</p></div>'
+    )
+
+
+def write_zip(path, pages, images):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, html in pages.items():
+            zf.writestr(PUBLISHED_PREFIX + name, html)
+        for name, blob in images.items():
+            zf.writestr(PUBLISHED_PREFIX + name, blob)
+    path.write_bytes(buf.getvalue())
+
+
+@pytest.fixture
+def site(tmp_path):
+    zip_path = tmp_path / "takeout.zip"
+    pages = {
+        "Sepsis.html": page_html("Sepsis", 'Sepsis <a href="Shock.html">shock</a><img src="img/a.png">'),
+        "Shock.html": page_html("Shock", 'Shock <img src="img/b.png">'),
+    }
+    images = {"img/a.png": b"A", "img/b.png": b"B"}
+    write_zip(zip_path, pages, images)
+
+    supabase = FakeSupabase()
+    import_takeout(str(zip_path), None, False, supabase=supabase)
+    # scripts/cleanup_blog_content.py PATCHes every post after the import.
+    for slug, row in supabase.rows.items():
+        supabase.bump(slug, {"content": clean_content(row["content"])[0]})
+
+    def export(limit=None):
+        return export_static(
+            str(zip_path),
+            str(tmp_path / "out"),
+            "https://emgurus.test/",
+            limit,
+            supabase,
+            url_prefix="/static-blog",
+            sitemap_path=str(tmp_path / "sitemap.xml"),
+        )
+
+    return {
+        "zip": zip_path,
+        "pages": pages,
+        "images": images,
+        "supabase": supabase,
+        "out": tmp_path / "out",
+        "sitemap": tmp_path / "sitemap.xml",
+        "export": export,
+    }
+
+
+def read_post(site, slug):
+    return json.loads((site["out"] / "posts" / f"{slug}.json").read_text())
+
+
+def test_export_matches_imported_and_cleaned_content(site):
+    site["export"]()
+    row = site["supabase"].rows["sepsis"]
+    post = read_post(site, "sepsis")
+
+    [asset] = json.loads((site["out"] / "manifest.json").read_text())["posts"]["sepsis"]["assets"]
+    stored_asset_url = site["supabase"].public_asset_url("takeout/sepsis/a.png")
+    assert stored_asset_url in row["content"]
+    assert post["content"] == row["content"].replace(stored_asset_url, f"/static-blog/{asset}")
+    assert post["cover_image_url"] == f"/static-blog/{asset}"
+    assert "EM Gurus &gt;" not in post["content"]
+    assert 'style=""' not in post["content"]
+    assert 'href="/blog/shock"' in post["content"]
+    assert post["updated_at"] == row["updated_at"]
+    assert "https://emgurus.test/blog/sepsis" in site["sitemap"].read_text()
+
+
+def test_unchanged_posts_are_skipped(site):
+    assert site["export"]().written == 2
+    mtime = (site["out"] / "posts" / "sepsis.json").stat().st_mtime_ns
+
+    stats = site["export"]()
+    assert (stats.written, stats.unchanged) == (0, 2)
+    assert (site["out"] / "posts" / "sepsis.json").stat().st_mtime_ns == mtime
+
+
+def test_updated_row_is_rewritten(site):
+    site["export"]()
+    site["supabase"].bump("shock", {"content": "<p>Edited</p>"})
+
+    stats = site["export"]()
+    assert (stats.written, stats.unchanged) == (1, 1)
+    post = read_post(site, "shock")
+    assert post["content"] == "<p>Edited</p>"
+    assert post["updated_at"] == site["supabase"].rows["shock"]["updated_at"]
+
+
+def test_changed_image_replaces_old_asset(site):
+    site["export"]()
+    old_assets = {p.name for p in (site["out"] / "assets").iterdir()}
+
+    write_zip(site["zip"], site["pages"], {**site["images"], "img/a.png": b"A2"})
+    stats = site["export"]()
+
+    new_assets = {p.name for p in (site["out"] / "assets").iterdir()}
+    assert (stats.written, stats.removed_assets) == (1, 1)
+    assert len(new_assets) == 2 and new_assets != old_assets
+    new_cover = read_post(site, "sepsis")["cover_image_url"].rsplit("/", 1)[1]
+    assert new_cover in new_assets - old_assets
+    assert new_cover in read_post(site, "sepsis")["content"]
+
+
+def test_removed_page_prunes_post_and_assets(site):
+    site["export"]()
+    write_zip(site["zip"], {"Sepsis.html": site["pages"]["Sepsis.html"]}, site["images"])
+
+    stats = site["export"]()
+    assert (stats.removed, stats.removed_assets) == (1, 1)
+    assert not (site["out"] / "posts" / "shock.json").exists()
+    manifest = json.loads((site["out"] / "manifest.json").read_text())
+    assert list(manifest["posts"]) == ["sepsis"]
+    assert "blog/shock" not in site["sitemap"].read_text()
+
+
+def test_limit_run_keeps_unvisited_posts(site):
+    site["export"]()
+    site["supabase"].bump("shock", {"content": "<p>Edited</p>"})
+
+    stats = site["export"](limit=1)
+    assert (stats.written, stats.unchanged, stats.removed, stats.removed_assets) == (0, 1, 0, 0)
+    manifest = json.loads((site["out"] / "manifest.json").read_text())
+    assert sorted(manifest["posts"]) == ["sepsis", "shock"]
+    assert (site["out"] / "posts" / "shock.json").exists()
+    assert len(list((site["out"] / "assets").iterdir())) == 2
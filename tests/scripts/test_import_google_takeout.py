@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("requests")
+
+from import_google_takeout import (  # noqa: E402
+    ContentBlock,
+    TakeoutPage,
+    boilerplate_page_threshold,
+    join_content_blocks,
+    strip_site_boilerplate,
+)
+
+
+def make_page(i, texts):
+    blocks = [ContentBlock(html=f"<div>{t}</div>", text=t) for t in texts]
+    content_html, excerpt = join_content_blocks(blocks)
+    return TakeoutPage(
+        html_path=f"page{i}.html",
+        file_name=f"page{i}.html",
+        slug=f"page{i}",
+        title=f"Page {i}",
+        content_html=content_html,
+        excerpt=excerpt,
+        raw=b"",
+        blocks=blocks,
+    )
+
+
+def test_site_wide_disclaimer_is_stripped(disclaimer, random_text):
+    pages = [make_page(i, [random_text(i), disclaimer]) for i in range(6)]
+    stats = strip_site_boilerplate(pages)
+    assert stats.stripped_blocks == 6
+    assert all(disclaimer not in p.content_html for p in pages)
+
+
+def test_short_heading_blocks_are_kept(random_text):
+    pages = [make_page(i, ["References", random_text(i)]) for i in range(6)]
+    stats = strip_site_boilerplate(pages)
+    assert stats.stripped_blocks == 0
+    assert all(p.content_html.startswith("<div>References</div>") for p in pages)
+
+
+def test_block_below_page_threshold_is_kept(disclaimer, random_text):
+    pages = [make_page(i, [random_text(i), disclaimer if i < 4 else random_text(i + 100)]) for i in range(6)]
+    assert strip_site_boilerplate(pages).stripped_blocks == 0
+
+
+def test_explicit_min_pages_overrides_fraction(disclaimer, random_text):
+    assert boilerplate_page_threshold(10_000, None, 0.05) == 500
+    assert boilerplate_page_threshold(10_000, 3, 0.05) == 3
+    assert boilerplate_page_threshold(40, None, 0.05) == 5
+
+    # 3 of 100 pages share a section navigation block: only stripped when asked.
+    pages = [make_page(i, [random_text(i), disclaimer if i < 3 else random_text(i + 1000)]) for i in range(100)]
+    assert strip_site_boilerplate(pages).stripped_blocks == 0
+    assert strip_site_boilerplate(pages, min_pages=3).stripped_blocks == 3